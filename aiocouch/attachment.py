@@ -29,6 +29,7 @@
 from typing import cast
 
 from .remote import RemoteAttachment
+from .typing import BinaryData
 
 
 class Attachment(RemoteAttachment):
@@ -61,10 +62,12 @@ class Attachment(RemoteAttachment):
         """
         return await self._get()
 
-    async def save(self, data: bytes, content_type: str) -> None:
+    async def save(self, data: BinaryData, content_type: str) -> None:
         """Saves the given attachment content on the server
 
-        :param data: the content of the attachment
+        :param data: the content of the attachment. Besides :class:`bytes`, this can
+            be a binary file object or an async iterable of :class:`bytes`, which are
+            streamed to the server without reading the whole content into memory.
         :param content_type: the content type of the given data. (See
             `Content type <https://www.w3.org/Protocols/rfc2616/rfc2616-sec14.html#sec14.17>`_)
 
@@ -90,19 +90,22 @@ class BulkOperation:
         if exc_type is not None:
             return
 
-        # @VTTI: Yes, we actually need doc._data and not doc.data here
-        docs = [doc._data for doc in self._docs if doc._dirty_cache]
-
-        if docs:
-            self.response = cast(List[JsonDict], await self._database._bulk_docs(docs))
+        # checking for changes hashes the whole document, so only do it once
+        dirty_docs = [doc for doc in self._docs if doc._dirty_cache]
+
+        if dirty_docs:
+            # @VTTI: Yes, we actually need doc._data and not doc.data here
+            self.response = cast(
+                List[JsonDict],
+                await self._database._bulk_docs([doc._data for doc in dirty_docs]),
+            )
         else:
             self.response = []
 
         self.ok = []
         self.error = []
 
-        result_docs = [doc for doc in self._docs if doc._dirty_cache]
-        for status, doc in zip(self.response, result_docs):
+        for status, doc in zip(self.response, dirty_docs):
             assert status["id"] == doc.id
             if "ok" in status:
                 doc._update_rev_after_save(status)
@@ -47,7 +47,37 @@ class CouchDB:
     :param str user: user used for authentication
     :param str password: password for authentication
     :param str cookie: The session cookie used for authentication
-    :param Any kwargs: Any other kwargs are passed to :class:`aiohttp.ClientSession`
+    :param int limit: The maximum number of simultaneous connections, defaults to 256
+    :param int limit_per_host: The maximum number of simultaneous connections to the
+        same endpoint, defaults to 0 (no limit)
+    :param float keepalive_timeout: The number of seconds an idle connection is kept
+        open for reuse, defaults to 75
+    :param bool coalesce_requests: If ``True``, identical GET and HEAD requests,
+        which are in flight at the same time, share a single request. Requests issued
+        after a modifying request of the session are never shared with older ones.
+        Defaults to ``False``.
+    :param int etag_cache_size: The number of GET responses kept to revalidate with
+        their ETag, such that unchanged documents and views are not transferred
+        again. Defaults to 0, which disables the cache.
+    :param float get_batch_delay: If set, documents fetched within this many seconds
+        are requested together with a single ``_bulk_get`` request. Defaults to
+        ``None``, which fetches every document with its own request.
+    :param int get_batch_size: The maximum number of documents requested with a
+        single ``_bulk_get`` request, a full batch is sent without waiting for the
+        delay. Defaults to 100.
+    :param float missing_cache_ttl: The number of seconds a document, which was
+        found missing by :meth:`~aiocouch.database.Database.create`, is reported as
+        missing without asking the server again. Any modifying request within the
+        session resets this, but documents created by other clients may be reported
+        as missing for that long. Defaults to 0, which disables this.
+    :param bool stream_rows: If ``True`` and ijson is installed, the rows of views
+        and the results of the non-continuous changes feed are parsed while they are
+        received, instead of buffering the whole response first. ijson fails to
+        parse rows containing integers beyond 64 bit. Defaults to ``False``.
+    :param dict headers: Headers sent with every request, e.g.,
+        ``{"Accept-Encoding": "identity"}`` to disable compressed responses.
+    :param Any kwargs: Any other kwargs are passed to :class:`aiohttp.ClientSession`.
+        If a ``connector`` is passed, the connection limits above are ignored.
 
     """
 
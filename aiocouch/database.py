@@ -340,6 +340,10 @@ class Database(RemoteDatabase):
         For convenience, the ``last-event-id`` parameter can also be passed
         as ``last_event_id``.
 
+        If the documents of the events are needed, pass ``include_docs=True``.
+        Then, :meth:`~aiocouch.event.ChangedEvent.doc` uses the data sent with the
+        event instead of fetching every document with a separate request.
+
         """
         params.setdefault("last-event-id", last_event_id)
 
@@ -30,9 +30,11 @@
 
 from typing import Any, Optional
 
+from . import database
 from .document import Document
 from .exception import ConflictError
 from .remote import _quote_id
+from .typing import JsonDict
 from .view import View
 
 
@@ -49,9 +51,11 @@ class DesignDocument(Document):
         "views",
     ]
 
-    @property
-    def endpoint(self) -> str:
-        return f"{self._database.endpoint}/_design/{_quote_id(self.id)}"
+    def __init__(
+        self, database: "database.Database", id: str, data: Optional[JsonDict] = None
+    ):
+        super().__init__(database, id, data=data)
+        self.endpoint = f"{database.endpoint}/_design/{_quote_id(id)}"
 
     def __setitem__(self, key: str, value: Any) -> None:
         if key in self._allowed_keys:
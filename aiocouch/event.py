@@ -29,45 +29,48 @@
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import cast
-
-from attr import dataclass
+from attr import dataclass, ib
 
 from . import database as db
 from . import document
 from .typing import JsonDict
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseChangeEvent:
     """The base event for shared properties"""
 
     json: JsonDict
     """The raw data of the event as JSON"""
 
-    @property
-    def id(self) -> str:
-        """Returns the id of the document"""
-        return cast(str, self.json["id"])
+    id: str = ib(init=False, repr=False, eq=False)
+    """The id of the document"""
+
+    rev: str = ib(init=False, repr=False, eq=False)
+    """The new rev of the document"""
 
-    @property
-    def rev(self) -> str:
-        """Returns the new rev of the document"""
-        return cast(str, self.json["changes"][0]["rev"])
+    sequence: str = ib(init=False, repr=False, eq=False)
+    """The sequence identifier of the event"""
 
-    @property
-    def sequence(self) -> str:
-        """Returns the sequence identifier of the event"""
-        return cast(str, self.json["seq"])
+    def __attrs_post_init__(self) -> None:
+        json = self.json
+        if "last_seq" in json:
+            # the final status line of a continuous feed isn't a change and
+            # has none of these fields
+            return
+        self.id = json["id"]
+        self.rev = json["changes"][0]["rev"]
+        self.sequence = json["seq"]
 
 
+@dataclass(slots=True)
 class DeletedEvent(BaseChangeEvent):
     """This event denotes that the document got deleted"""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class ChangedEvent(BaseChangeEvent):
     """This event denotes that the document got modified"""
 
@@ -29,7 +29,7 @@
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import functools
-from contextlib import suppress
+from string import Formatter
 from typing import (
     Any,
     AsyncGenerator,
@@ -37,6 +37,7 @@ from typing import (
     Dict,
     NoReturn,
     Optional,
+    Tuple,
     Type,
     TypeVar,
     cast,
@@ -117,59 +118,145 @@ def raise_for_endpoint(
     message: str,
     exception: aiohttp.ClientResponseError,
     exception_type: Optional[Type[Exception]] = None,
+) -> NoReturn:
+    if "{" in message:
+        message = message.format(**_message_input(endpoint))
+
+    _raise_with_message(message, exception, exception_type)
+
+
+def _raise_with_message(
+    message: str,
+    exception: aiohttp.ClientResponseError,
+    exception_type: Optional[Type[Exception]] = None,
 ) -> NoReturn:
     if exception_type is None:
-        if exception.status == 400:
-            exception_type = BadRequestError
-        elif exception.status == 401:
-            exception_type = UnauthorizedError
-        elif exception.status == 403:
-            exception_type = ForbiddenError
-        elif exception.status == 404:
-            exception_type = NotFoundError
-        elif exception.status == 409:
-            exception_type = ConflictError
-        elif exception.status == 412:
-            exception_type = PreconditionFailedError
-        elif exception.status == 415:
-            exception_type = UnsupportedMediaTypeError
-        elif exception.status == 417:
-            exception_type = ExpectationFailedError
-        else:
+        try:
+            exception_type = _STATUS_EXCEPTIONS[exception.status]
+        except KeyError:
             raise ValueError(
                 "Something went wrong, but I couldn't deduce the type of exception nor "
                 "format a nice exception for you. I'm sorry."
             ) from exception
 
-    message_input = {}
+    raise exception_type(message) from exception
+
+
+_STATUS_EXCEPTIONS: Dict[int, Type[Exception]] = {
+    400: BadRequestError,
+    401: UnauthorizedError,
+    403: ForbiddenError,
+    404: NotFoundError,
+    409: ConflictError,
+    412: PreconditionFailedError,
+    415: UnsupportedMediaTypeError,
+    417: ExpectationFailedError,
+}
+
+
+def _message_input(endpoint: Endpoint) -> Dict[str, Optional[str]]:
+    data = getattr(endpoint, "_data", None)
+    document = getattr(endpoint, "_document", None)
+    document_data = getattr(document, "_data", None)
+
+    return {
+        "id": getattr(endpoint, "id", None),
+        "endpoint": getattr(endpoint, "endpoint", None),
+        "rev": data.get("_rev") if data is not None else None,
+        "document_id": getattr(document, "id", None),
+        "document_rev": (
+            document_data.get("_rev") if document_data is not None else None
+        ),
+    }
+
 
-    with suppress(AttributeError):
-        message_input["id"] = endpoint.id
-        message_input["endpoint"] = endpoint.endpoint
-        message_input["rev"] = cast(str, endpoint._data.get("_rev"))
-    with suppress(AttributeError):
-        message_input["document_id"] = endpoint._document.id
-        message_input["document_rev"] = cast(str, endpoint._document._data.get("_rev"))
+_MESSAGE_FIELDS = frozenset(("id", "endpoint", "rev", "document_id", "document_rev"))
 
-    raise exception_type(message.format(**message_input)) from exception
+_Template = Tuple[Tuple[str, Optional[str]], ...]
+
+
+def _compile_message(message: str) -> Optional[_Template]:
+    """Splits a message template into literal text and replacement fields
+
+    Returns ``None`` if the template uses anything beyond plain ``{field}``
+    replacements, in which case it is formatted with :meth:`str.format`.
+    """
+    template = []
+    for literal, field, spec, conversion in Formatter().parse(message):
+        if field is not None and (field not in _MESSAGE_FIELDS or spec or conversion):
+            return None
+        template.append((literal, field))
+    return tuple(template)
 
 
 FuncT = TypeVar("FuncT", bound=Callable[..., Any])
 
 
+_Handler = Tuple[str, Optional[_Template], Optional[Type[Exception]]]
+_Handlers = Dict[int, _Handler]
+
+
+def _add_handler(
+    handlers: _Handlers,
+    status: int,
+    message: str,
+    exception_type: Optional[Type[Exception]],
+) -> None:
+    # Decorators are applied from the inside out, and the innermost
+    # decorator used to handle a status code first.
+    handlers.setdefault(status, (message, _compile_message(message), exception_type))
+
+
+def _handle(
+    handlers: _Handlers, endpoint: Endpoint, exception: aiohttp.ClientResponseError
+) -> NoReturn:
+    try:
+        message, template, exception_type = handlers[exception.status]
+    except KeyError:
+        raise exception from None
+    if template is None:
+        raise_for_endpoint(endpoint, message, exception, exception_type)
+
+    values = _message_input(endpoint)
+    message = "".join(
+        literal if field is None else f"{literal}{values[field]}"
+        for literal, field in template
+    )
+    _raise_with_message(message, exception, exception_type)
+
+
+# Stacked decorators are merged into a single wrapper. The wrapper keeps
+# itself and the handlers of all status codes in this attribute. As
+# functools.wraps copies the attribute to any other wrapper, only the wrapper
+# it names is merged with.
+_RAISES_HANDLERS = "_aiocouch_raises_handlers"
+_GENERATOR_RAISES_HANDLERS = "_aiocouch_generator_raises_handlers"
+
+
+def _unwrap(func: Callable[..., Any], attribute: str) -> Tuple[Any, _Handlers]:
+    marker: Optional[Tuple[Any, _Handlers]] = getattr(func, attribute, None)
+    if marker is not None and marker[0] is func:
+        # The handlers are copied, the decorated function may still be used
+        # on its own, e.g., if a subclass decorates an inherited method.
+        return getattr(func, "__wrapped__"), dict(marker[1])
+    return func, {}
+
+
 def raises(
     status: int, message: str, exception_type: Optional[Type[Exception]] = None
 ) -> Callable[[FuncT], FuncT]:
     def decorator_raises(func: FuncT) -> FuncT:
-        @functools.wraps(func)
+        wrapped, handlers = _unwrap(func, _RAISES_HANDLERS)
+        _add_handler(handlers, status, message, exception_type)
+
+        @functools.wraps(wrapped)
         async def wrapper(endpoint: Endpoint, *args: Any, **kwargs: Any) -> Any:
             try:
-                return await func(endpoint, *args, **kwargs)
+                return await wrapped(endpoint, *args, **kwargs)
             except aiohttp.ClientResponseError as exception:
-                if status == exception.status:
-                    raise_for_endpoint(endpoint, message, exception, exception_type)
-                raise exception
+                _handle(handlers, endpoint, exception)
 
+        setattr(wrapper, _RAISES_HANDLERS, (wrapper, handlers))
         return cast(FuncT, wrapper)
 
     return decorator_raises
@@ -179,18 +266,20 @@ def generator_raises(
     status: int, message: str, exception_type: Optional[Type[Exception]] = None
 ) -> Callable[[FuncT], FuncT]:
     def decorator_raises(func: FuncT) -> FuncT:
-        @functools.wraps(func)
+        wrapped, handlers = _unwrap(func, _GENERATOR_RAISES_HANDLERS)
+        _add_handler(handlers, status, message, exception_type)
+
+        @functools.wraps(wrapped)
         async def wrapper(
             endpoint: Endpoint, *args: Any, **kwargs: Any
         ) -> AsyncGenerator[Any, None]:
             try:
-                async for data in func(endpoint, *args, **kwargs):
+                async for data in wrapped(endpoint, *args, **kwargs):
                     yield data
             except aiohttp.ClientResponseError as exception:
-                if status == exception.status:
-                    raise_for_endpoint(endpoint, message, exception, exception_type)
-                raise exception
+                _handle(handlers, endpoint, exception)
 
+        setattr(wrapper, _GENERATOR_RAISES_HANDLERS, (wrapper, handlers))
         return cast(FuncT, wrapper)
 
     return decorator_raises
@@ -29,16 +29,91 @@
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import asyncio
+import functools
 import json
+import math
+import re
+import time
+from collections import OrderedDict
 from contextlib import suppress
-from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple, Union, cast
-from urllib.parse import quote
+from string import ascii_letters, digits
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 import aiohttp
+from yarl import URL
 
 from . import database, document
-from .exception import NotFoundError, generator_raises, raises
-from .typing import JsonDict
+from .exception import generator_raises, raises
+from .typing import BinaryData, JsonDict
+
+
+def _stdlib_json_dumps(data: Any) -> bytes:
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def _has_non_finite_float(data: Any) -> bool:
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, dict):
+        return any(_has_non_finite_float(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(_has_non_finite_float(value) for value in data)
+    return False
+
+
+try:
+    import orjson
+
+    # Types which the json module can't encode either must not be encoded by
+    # orjson, as far as orjson allows that. Non str keys are rejected by
+    # orjson and left to the json module as well. UUIDs and enums are always
+    # encoded by orjson, while the json module rejects them.
+    _ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    # orjson silently decodes integers beyond 64 bit as float, these are the
+    # only integers which have 20 digits or are negative with 19 digits
+    _LONG_NUMBER = re.compile(rb"\d{20}|-\d{19}")
+
+    def _json_loads(data: Union[bytes, bytearray]) -> Any:
+        if _LONG_NUMBER.search(data):
+            # may be a false positive, e.g., a long float or digits in a string
+            return json.loads(data)
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # e.g., numbers beyond the range of a double, which json accepts
+            return json.loads(data)
+
+    def _json_dumps(data: Any) -> bytes:
+        try:
+            encoded = orjson.dumps(data, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # e.g., integers beyond 64 bit or int keys, which json encodes just
+            # fine, or types json rejects as well
+            return _stdlib_json_dumps(data)
+        if b"null" in encoded and _has_non_finite_float(data):
+            # orjson silently replaces NaN and infinity with null
+            return _stdlib_json_dumps(data)
+        return encoded
+
+except ImportError:  # pragma: no cover
+
+    def _json_loads(data: Union[bytes, bytearray]) -> Any:
+        return json.loads(data)
+
+    _json_dumps = _stdlib_json_dumps
 
 
 class HTTPResponse:
@@ -47,12 +122,12 @@ class HTTPResponse:
     status: int
     """The HTTP response status, usually 200, 201 or 202"""
 
-    headers: Dict[str, str]
-    """The HTTP headers of the response"""
+    headers: Mapping[str, str]
+    """The HTTP headers of the response as a read-only, case-insensitive mapping"""
 
     def __init__(self, resp: aiohttp.client.ClientResponse):
         self.status = resp.status
-        self.headers = dict(resp.headers)
+        self.headers = resp.headers
 
     @property
     def etag(self) -> Optional[str]:
@@ -60,31 +135,86 @@ class HTTPResponse:
         return self.headers["Etag"][1:-1] if "Etag" in self.headers else None
 
 
-RequestResult = Tuple[HTTPResponse, Union[bytes, JsonDict]]
+RequestResult = Tuple[HTTPResponse, JsonDict]
+RawRequestResult = Tuple[HTTPResponse, bytes]
 
+# only side-effect free requests may share a response, see RFC 7231, section 4.2.1
+_COALESCED_METHODS = frozenset(("GET", "HEAD"))
 
+
+try:
+    import ijson  # type: ignore
+except ImportError:  # pragma: no cover
+    ijson = None
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# whether ClientSession.close() waits for the connections, see close()
+_CLOSE_WAITS_FOR_CONNECTIONS = hasattr(aiohttp.client_proto.ResponseHandler, "closed")
+
+# streamed responses, e.g., continuous change feeds, may stay open indefinitely
+_NO_TIMEOUT = aiohttp.ClientTimeout()
+
+# the maximum number of documents remembered as missing by _exists()
+_MISSING_DOCUMENTS_SIZE = 1024
+
+# A document id waiting for the next _bulk_get request. The future resolves to
+# None if the document couldn't be fetched that way and needs a plain GET.
+_PendingGet = Tuple[str, "asyncio.Future[Optional[JsonDict]]"]
+
+
+# characters that are never percent-encoded, see RFC 3986, section 2.3
+_UNRESERVED = frozenset(ascii_letters + digits + "-._~")
+
+# the percent-encoding of every byte, same as urllib.parse.quote(..., safe="")
+_QUOTED_BYTES = [chr(b) if chr(b) in _UNRESERVED else f"%{b:02X}" for b in range(256)]
+
+
+# database and document ids tend to be used over and over again
+@functools.lru_cache(maxsize=4096)
 def _quote_id(id: str) -> str:
-    return quote(id, safe="")
+    if _UNRESERVED.issuperset(id):
+        return id
+    return "".join([_QUOTED_BYTES[b] for b in id.encode()])
 
 
 def _stringify_params(params: Optional[JsonDict]) -> Optional[JsonDict]:
     if params is None:
         return None
-    result = {}
-    for key, value in params.items():
-        if value is None:
-            continue
-        elif value is True:
-            value = "true"
-        elif value is False:
-            value = "false"
-
-        result[key] = value
-
-    return result
+    for value in params.values():
+        if value is None or value is True or value is False:
+            break
+    else:
+        # nothing to convert, e.g., only strings and numbers
+        return params
+    return {
+        key: "true" if value is True else "false" if value is False else value
+        for key, value in params.items()
+        if value is not None
+    }
 
 
 class RemoteServer:
+    __slots__ = (
+        "_server",
+        "_base_url",
+        "_base_path",
+        "_http_session",
+        "_inflight_requests",
+        "_coalesce_requests",
+        "_etag_cache",
+        "_etag_cache_size",
+        "_get_batch_delay",
+        "_get_batch_size",
+        "_batch_tasks",
+        "_missing_cache_ttl",
+        "_missing_documents",
+        "_modifications",
+        "_pending_gets",
+        "_stream_rows",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         server: str,
@@ -94,17 +224,50 @@ class RemoteServer:
         **kwargs: Any,
     ):
         self._server = server
+        self._base_url = URL(server)
+        self._base_path = self._base_url.raw_path.rstrip("/")
+        self._etag_cache_size: int = kwargs.pop("etag_cache_size", 0)
+        self._get_batch_delay: Optional[float] = kwargs.pop("get_batch_delay", None)
+        self._get_batch_size: int = kwargs.pop("get_batch_size", 100)
+        self._missing_cache_ttl: float = kwargs.pop("missing_cache_ttl", 0)
+        self._coalesce_requests: bool = kwargs.pop("coalesce_requests", False)
+        self._stream_rows: bool = kwargs.pop("stream_rows", False)
         auth = aiohttp.BasicAuth(user, password, "utf-8") if user and password else None
-        headers = {"Cookie": "AuthSession=" + cookie} if cookie else None
+        headers = kwargs.pop("headers", None)
+        if cookie:
+            headers = {**(headers or {}), "Cookie": "AuthSession=" + cookie}
+        # the connection limits only apply to the default connector
+        limit = kwargs.pop("limit", 256)
+        limit_per_host = kwargs.pop("limit_per_host", 0)
+        keepalive_timeout = kwargs.pop("keepalive_timeout", 75)
+        if "connector" not in kwargs:
+            kwargs["connector"] = aiohttp.TCPConnector(
+                limit=limit,
+                limit_per_host=limit_per_host,
+                keepalive_timeout=keepalive_timeout,
+                ttl_dns_cache=300,
+                loop=kwargs.get("loop"),
+            )
         self._http_session = aiohttp.ClientSession(headers=headers, auth=auth, **kwargs)
+        self._inflight_requests: Dict[
+            Tuple[Any, ...], "asyncio.Future[Tuple[HTTPResponse, bytes]]"
+        ] = {}
+        self._etag_cache: "OrderedDict[Tuple[Any, ...], Tuple[HTTPResponse, bytes]]"
+        self._etag_cache = OrderedDict()
+        self._pending_gets: Dict[str, List[_PendingGet]] = {}
+        self._batch_tasks: Set["asyncio.Future[None]"] = set()
+        # maps endpoints of documents found missing to the expiry time
+        self._missing_documents: Dict[str, float] = {}
+        # counts the start and end of modifying requests, see _set_missing()
+        self._modifications = 0
 
     async def _get(self, path: str, params: Optional[JsonDict] = None) -> RequestResult:
-        return await self._request("GET", path, params=params)
+        return await self._request_json("GET", path, params=params)
 
     async def _get_bytes(
         self, path: str, params: Optional[JsonDict] = None
-    ) -> RequestResult:
-        return await self._request("GET", path, params=params, return_json=False)
+    ) -> RawRequestResult:
+        return await self._request("GET", path, params=params)
 
     async def _put(
         self,
@@ -112,59 +275,311 @@ class RemoteServer:
         data: Optional[JsonDict] = None,
         params: Optional[JsonDict] = None,
     ) -> RequestResult:
-        return await self._request("PUT", path, json=data, params=params)
+        return await self._request_json("PUT", path, params=params, body=data)
 
     async def _put_bytes(
         self,
         path: str,
-        data: bytes,
+        data: BinaryData,
         content_type: str,
         params: Optional[JsonDict] = None,
     ) -> RequestResult:
-        return await self._request(
+        return await self._request_json(
             "PUT",
             path,
-            data=data,
             params=params,
+            data=data,
             headers={"Content-Type": content_type},
         )
 
     async def _post(
-        self, path: str, data: JsonDict, params: Optional[JsonDict] = None
+        self,
+        path: str,
+        data: JsonDict,
+        params: Optional[JsonDict] = None,
+        *,
+        modifies: bool = True,
     ) -> RequestResult:
-        return await self._request("POST", path, json=data, params=params)
+        return await self._request_json(
+            "POST", path, params=params, body=data, modifies=modifies
+        )
 
     async def _delete(
         self, path: str, params: Optional[JsonDict] = None
     ) -> RequestResult:
-        return await self._request("DELETE", path, params=params)
+        return await self._request_json("DELETE", path, params=params)
 
     async def _head(
+        self, path: str, params: Optional[JsonDict] = None
+    ) -> RawRequestResult:
+        return await self._request("HEAD", path, params=params)
+
+    async def _request_json(
         self,
+        method: str,
         path: str,
         params: Optional[JsonDict] = None,
-        **kwargs: Any,
+        *,
+        body: Optional[JsonDict] = None,
+        data: Optional[BinaryData] = None,
+        headers: Optional[Dict[str, str]] = None,
+        modifies: bool = True,
     ) -> RequestResult:
-        return await self._request("HEAD", path, params=params, **kwargs)
+        response, raw = await self._request(
+            method,
+            path,
+            params,
+            body=body,
+            data=data,
+            headers=headers,
+            modifies=modifies,
+        )
+        # the raw bytes are parsed directly, without decoding to str
+        return response, _json_loads(raw) if raw else {}
 
     async def _request(
         self,
         method: str,
         path: str,
         params: Optional[JsonDict] = None,
-        return_json: bool = True,
-        **kwargs: Any,
-    ) -> RequestResult:
-        kwargs["params"] = _stringify_params(params) if params else {}
+        *,
+        body: Optional[JsonDict] = None,
+        data: Optional[BinaryData] = None,
+        headers: Optional[Dict[str, str]] = None,
+        modifies: bool = True,
+    ) -> RawRequestResult:
+        if (
+            method in _COALESCED_METHODS
+            and (self._coalesce_requests or self._etag_cache_size > 0)
+            and body is None
+            and data is None
+            and headers is None
+        ):
+            # by default, reads go straight to _send_request without a key
+            key = (method, path, tuple(params.items()) if params else ())
+            try:
+                hash(key)
+            except TypeError:
+                # unhashable parameter values, e.g., lists
+                return await self._send_request(method, path, params)
+            if self._coalesce_requests:
+                return await self._coalesced_request(key, method, path, params)
+            return await self._send_read_request(key, method, path, params)
+        return await self._send_request(
+            method,
+            path,
+            params,
+            body=body,
+            data=data,
+            headers=headers,
+            modifies=modifies,
+        )
 
-        async with self._http_session.request(
-            method, url=f"{self._server}{path}", **kwargs
-        ) as resp:
-            resp.raise_for_status()
-            return (
-                HTTPResponse(resp),
-                await resp.json() if return_json else await resp.read(),
+    def _send_read_request(
+        self, key: Tuple[Any, ...], method: str, path: str, params: Optional[JsonDict]
+    ) -> Awaitable[Tuple[HTTPResponse, bytes]]:
+        if method == "GET" and self._etag_cache_size > 0:
+            return self._send_cached_request(key, path, params)
+        return self._send_request(method, path, params)
+
+    async def _coalesced_request(
+        self, key: Tuple[Any, ...], method: str, path: str, params: Optional[JsonDict]
+    ) -> Tuple[HTTPResponse, bytes]:
+        # Identical requests that are in flight at the same time share one
+        # round-trip. Every caller parses the shared body on its own, so no
+        # two callers end up with the same (mutable) JSON object.
+        task = self._inflight_requests.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._send_read_request(key, method, path, params)
             )
+            self._inflight_requests[key] = task
+
+            def done(task: "asyncio.Future[Tuple[HTTPResponse, bytes]]") -> None:
+                if self._inflight_requests.get(key) is task:
+                    del self._inflight_requests[key]
+                # mark the exception as retrieved, in case all callers are gone
+                if not task.cancelled():
+                    task.exception()
+
+            task.add_done_callback(done)
+
+        # a cancelled caller must not cancel the request of the other callers
+        return await asyncio.shield(task)
+
+    async def _batched_get(self, database: str, id: str) -> Optional[JsonDict]:
+        # Documents requested within the batch delay are fetched together with
+        # one _bulk_get request. Errors are not reported here, the caller has
+        # to repeat the request with a plain GET instead.
+        future: "asyncio.Future[Optional[JsonDict]]"
+        future = asyncio.get_event_loop().create_future()
+
+        pending = self._pending_gets.get(database)
+        if pending is None:
+            pending = self._pending_gets[database] = []
+            self._spawn(self._flush_gets(database, pending))
+        pending.append((id, future))
+
+        if len(pending) >= self._get_batch_size:
+            # a full batch doesn't need to wait for more documents
+            del self._pending_gets[database]
+            self._spawn(self._bulk_get_batch(database, pending))
+
+        return await future
+
+    def _spawn(self, coroutine: Awaitable[None]) -> None:
+        # the event loop only keeps weak references to tasks
+        task = asyncio.ensure_future(coroutine)
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _flush_gets(self, database: str, pending: List[_PendingGet]) -> None:
+        assert self._get_batch_delay is not None
+        await asyncio.sleep(self._get_batch_delay)
+        # the batch may already be sent, because it was full
+        if self._pending_gets.get(database) is pending:
+            del self._pending_gets[database]
+            await self._bulk_get_batch(database, pending)
+
+    async def _bulk_get_batch(self, database: str, batch: List[_PendingGet]) -> None:
+        results: List[JsonDict] = []
+        try:
+            if len(batch) > 1:
+                _, json = await self._post(
+                    f"{database}/_bulk_get",
+                    {"docs": [{"id": id} for id, _ in batch]},
+                    modifies=False,
+                )
+                results = json["results"]
+        except aiohttp.ClientResponseError:
+            # e.g., missing permissions or a server without _bulk_get
+            pass
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        # the results are in the same order as the requested documents
+        if len(results) != len(batch):
+            results = [{}] * len(batch)
+
+        for (id, future), result in zip(batch, results):
+            if future.done():
+                # the caller was cancelled
+                continue
+            # Unlike a plain GET, _bulk_get returns deleted documents and may
+            # return several revisions of conflicted documents. Those are left
+            # to the plain GET.
+            docs = result.get("docs")
+            if (
+                result.get("id") == id
+                and docs
+                and len(docs) == 1
+                and "ok" in docs[0]
+                and not docs[0]["ok"].get("_deleted")
+            ):
+                future.set_result(docs[0]["ok"])
+            else:
+                future.set_result(None)
+
+    def _url(self, path: str) -> URL:
+        # All paths are built from quoted ids, so yarl doesn't need to parse
+        # and requote the whole URL for every request.
+        return self._base_url.with_path(self._base_path + path, encoded=True)
+
+    async def _send_cached_request(
+        self, key: Tuple[Any, ...], path: str, params: Optional[JsonDict]
+    ) -> Tuple[HTTPResponse, bytes]:
+        # The server revalidates every request, so a cached body is only used
+        # if it is still current. Only the raw body is kept, as callers are
+        # free to modify the parsed JSON.
+        cached = self._etag_cache.get(key)
+        headers = None
+        if cached is not None:
+            headers = {"If-None-Match": cached[0].headers["Etag"]}
+
+        response, raw = await self._send_request("GET", path, params, headers=headers)
+
+        if response.status == 304 and cached is not None:
+            self._etag_cache.move_to_end(key)
+            return cached
+
+        if "Etag" in response.headers:
+            self._etag_cache[key] = (response, raw)
+            self._etag_cache.move_to_end(key)
+            if len(self._etag_cache) > self._etag_cache_size:
+                self._etag_cache.popitem(last=False)
+        else:
+            self._etag_cache.pop(key, None)
+        return response, raw
+
+    def _is_known_missing(self, path: str) -> bool:
+        expires = self._missing_documents.get(path)
+        if expires is None:
+            return False
+        if expires > time.monotonic():
+            return True
+        del self._missing_documents[path]
+        return False
+
+    def _set_missing(self, path: str, modifications: int) -> None:
+        if self._missing_cache_ttl <= 0:
+            return
+        if modifications != self._modifications:
+            # a modification ran in the meantime, it may have created the document
+            return
+        if len(self._missing_documents) >= _MISSING_DOCUMENTS_SIZE:
+            self._missing_documents.clear()
+        self._missing_documents[path] = time.monotonic() + self._missing_cache_ttl
+
+    async def _send_request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[JsonDict] = None,
+        *,
+        body: Optional[JsonDict] = None,
+        data: Optional[BinaryData] = None,
+        headers: Optional[Dict[str, str]] = None,
+        modifies: bool = True,
+    ) -> Tuple[HTTPResponse, bytes]:
+        # read-only POST requests, e.g., _find, pass modifies=False
+        modifies = modifies and method not in _COALESCED_METHODS
+        if modifies:
+            # Reads started before a modification must not be shared with
+            # reads issued after it, they could return outdated data.
+            self._invalidate_reads()
+
+        if body is not None:
+            data = _json_dumps(body)
+            headers = _JSON_HEADERS if headers is None else {**headers, **_JSON_HEADERS}
+
+        try:
+            async with self._http_session.request(
+                method,
+                self._url(path),
+                params=_stringify_params(params) if params else {},
+                data=data,
+                headers=headers,
+            ) as resp:
+                if resp.status >= 400:
+                    resp.raise_for_status()
+                if method == "HEAD":
+                    # responses to HEAD requests never have a body
+                    return HTTPResponse(resp), b""
+                return HTTPResponse(resp), await resp.read()
+        finally:
+            if modifies:
+                # reads issued while the modification was in flight are outdated too
+                self._invalidate_reads()
+
+    def _invalidate_reads(self) -> None:
+        self._inflight_requests.clear()
+        # any modification may create one of the missing documents
+        self._modifications += 1
+        if self._missing_documents:
+            self._missing_documents.clear()
 
     async def _streamed_request(
         self,
@@ -174,38 +589,94 @@ class RemoteServer:
         **kwargs: Any,
     ) -> AsyncGenerator[JsonDict, None]:
         kwargs["params"] = _stringify_params(params) if params else {}
-        kwargs.setdefault("timeout", aiohttp.ClientTimeout())
+        kwargs.setdefault("timeout", _NO_TIMEOUT)
 
         async with self._http_session.request(
-            method, url=f"{self._server}{path}", **kwargs
+            method, url=self._url(path), **kwargs
         ) as resp:
-            resp.raise_for_status()
-
-            async for line in resp.content:
-                # this should only happen for empty lines
+            if resp.status >= 400:
+                resp.raise_for_status()
+
+            # Split the received chunks into lines ourselves, which is cheaper
+            # than reading the stream line by line.
+            buffer = bytearray()
+            async for chunk in resp.content.iter_any():
+                end = chunk.rfind(b"\n")
+                if end < 0:
+                    buffer += chunk
+                    continue
+                buffer += chunk[:end]
+                lines = buffer.split(b"\n")
+                buffer = bytearray(chunk[end + 1 :])
+                for line in lines:
+                    # skip the empty lines sent as heartbeat
+                    if line.strip():
+                        with suppress(json.JSONDecodeError):
+                            yield _json_loads(line)
+
+            if buffer.strip():
                 with suppress(json.JSONDecodeError):
-                    yield json.loads(line)
+                    yield _json_loads(buffer)
+
+    async def _streamed_rows(
+        self,
+        method: str,
+        path: str,
+        params: Optional[JsonDict] = None,
+        *,
+        body: Optional[JsonDict] = None,
+        key: str = "rows",
+    ) -> AsyncGenerator[JsonDict, None]:
+        if ijson is None or not self._stream_rows:
+            _, json = await self._request_json(method, path, params, body=body)
+            for row in json[key]:
+                yield row
+            return
+
+        # With ijson, the rows are parsed while the response is received, so
+        # the whole response is never held in memory at once. As the response
+        # stays open while the caller processes the rows, the total timeout
+        # of the session must not apply, only the limits for connecting and
+        # waiting for data. Without a limit for waiting for data, the total
+        # timeout is used for that, so a stalled server can't hang forever.
+        timeout = self._http_session.timeout
+        async with self._http_session.request(
+            method,
+            self._url(path),
+            params=_stringify_params(params) if params else {},
+            data=_json_dumps(body) if body is not None else None,
+            headers=_JSON_HEADERS if body is not None else None,
+            timeout=aiohttp.ClientTimeout(
+                connect=timeout.connect,
+                sock_connect=timeout.sock_connect,
+                sock_read=timeout.sock_read or timeout.total,
+            ),
+        ) as resp:
+            if resp.status >= 400:
+                resp.raise_for_status()
+
+            async for row in ijson.items_async(
+                resp.content, f"{key}.item", use_float=True
+            ):
+                yield row
 
     @raises(401, "Invalid credentials")
     async def _all_dbs(self, **params: Any) -> List[str]:
         _, json = await self._get("/_all_dbs", params)
-        assert not isinstance(json, bytes)
         return cast(List[str], json)
 
     async def close(self) -> None:
         # If ClientSession has TLS/SSL connections, it is needed to wait 250 ms
         # before closing, see https://github.com/aio-libs/aiohttp/issues/1925.
-        has_ssl_conn = self._http_session.connector and any(
-            any(hasattr(handler.transport, "_ssl_protocol") for handler, _ in conn)
-            for conn in self._http_session.connector._conns.values()
-        )
+        # Newer aiohttp versions wait until all connections are closed.
+        has_ssl_conn = self._server.lower().startswith("https:")
         await self._http_session.close()
-        await asyncio.sleep(0.250 if has_ssl_conn else 0)
+        if has_ssl_conn and not _CLOSE_WAITS_FOR_CONNECTIONS:
+            await asyncio.sleep(0.250)
 
     @raises(401, "Invalid credentials")
     async def _info(self) -> JsonDict:
         _, json = await self._get("/")
-        assert not isinstance(json, bytes)
         return json
 
     @raises(401, "Authentication failed, check provided credentials.")
@@ -214,13 +685,12 @@ class RemoteServer:
 
 
 class RemoteDatabase:
+    __slots__ = ("id", "_remote", "endpoint", "__weakref__")
+
     def __init__(self, remote: RemoteServer, id: str):
         self.id = id
         self._remote = remote
-
-    @property
-    def endpoint(self) -> str:
-        return f"/{_quote_id(self.id)}"
+        self.endpoint = f"/{_quote_id(id)}"
 
     @raises(401, "Invalid credentials")
     @raises(403, "Read permission required")
@@ -239,7 +709,6 @@ class RemoteDatabase:
     @raises(404, "Requested database not found ({id})")
     async def _get(self) -> JsonDict:
         _, json = await self._remote._get(self.endpoint)
-        assert not isinstance(json, bytes)
         return json
 
     @raises(400, "Invalid database name")
@@ -247,7 +716,6 @@ class RemoteDatabase:
     @raises(412, "Database already exists")
     async def _put(self, **params: Any) -> JsonDict:
         _, json = await self._remote._put(self.endpoint, params=params)
-        assert not isinstance(json, bytes)
         return json
 
     @raises(400, "Invalid database name or forgotten document id by accident")
@@ -263,9 +731,8 @@ class RemoteDatabase:
     @raises(415, "Bad Content-Type value")
     async def _bulk_get(self, docs: List[str], **params: Any) -> JsonDict:
         _, json = await self._remote._post(
-            f"{self.endpoint}/_bulk_get", {"docs": docs}, params
+            f"{self.endpoint}/_bulk_get", {"docs": docs}, params, modifies=False
         )
-        assert not isinstance(json, bytes)
         return json
 
     @raises(400, "The request provided invalid JSON data")
@@ -275,7 +742,6 @@ class RemoteDatabase:
     async def _bulk_docs(self, docs: List[JsonDict], **data: Any) -> JsonDict:
         data["docs"] = docs
         _, json = await self._remote._post(f"{self.endpoint}/_bulk_docs", data)
-        assert not isinstance(json, bytes)
         return json
 
     @raises(400, "Invalid request")
@@ -284,8 +750,9 @@ class RemoteDatabase:
     @raises(500, "Query execution failed", RuntimeError)
     async def _find(self, selector: Any, **data: Any) -> JsonDict:
         data["selector"] = selector
-        _, json = await self._remote._post(f"{self.endpoint}/_find", data)
-        assert not isinstance(json, bytes)
+        _, json = await self._remote._post(
+            f"{self.endpoint}/_find", data, modifies=False
+        )
         return json
 
     @raises(400, "Invalid request")
@@ -295,21 +762,18 @@ class RemoteDatabase:
     async def _index(self, index: JsonDict, **data: Any) -> JsonDict:
         data["index"] = index
         _, json = await self._remote._post(f"{self.endpoint}/_index", data)
-        assert not isinstance(json, bytes)
         return json
 
     @raises(401, "Invalid credentials")
     @raises(403, "Permission required")
     async def _get_security(self) -> JsonDict:
         _, json = await self._remote._get(f"{self.endpoint}/_security")
-        assert not isinstance(json, bytes)
         return json
 
     @raises(401, "Invalid credentials")
     @raises(403, "Permission required")
     async def _put_security(self, doc: JsonDict) -> JsonDict:
         _, json = await self._remote._put(f"{self.endpoint}/_security", doc)
-        assert not isinstance(json, bytes)
         return json
 
     @generator_raises(400, "Invalid request")
@@ -321,11 +785,9 @@ class RemoteDatabase:
             ):
                 yield data
         else:
-            _, json = await self._remote._get(
-                f"{self.endpoint}/_changes", params=params
-            )
-            assert not isinstance(json, bytes)
-            for result in json["results"]:
+            async for result in self._remote._streamed_rows(
+                "GET", f"{self.endpoint}/_changes", params, key="results"
+            ):
                 yield result
 
     @raises(400, "Invalid database or JSON payload")
@@ -335,19 +797,17 @@ class RemoteDatabase:
         _, json = await self._remote._post(
             f"{self.endpoint}/_purge", data=docs, params=params
         )
-        assert not isinstance(json, bytes)
         return json
 
 
 class RemoteDocument:
+    __slots__ = ("_database", "id", "_data", "endpoint", "__weakref__")
+
     def __init__(self, database: "database.Database", id: str):
         self._database = database
         self.id = id
         self._data: Optional[JsonDict] = None
-
-    @property
-    def endpoint(self) -> str:
-        return f"{self._database.endpoint}/{_quote_id(self.id)}"
+        self.endpoint = f"{database.endpoint}/{_quote_id(id)}"
 
     @raises(401, "Read privilege required for document '{id}'")
     @raises(403, "Read privilege required for document '{id}'")
@@ -367,20 +827,41 @@ class RemoteDocument:
             "rev": response.headers["Etag"][1:-1],
         }
 
+    @raises(401, "Read privilege required for document '{id}'")
+    @raises(403, "Read privilege required for document '{id}'")
     async def _exists(self) -> bool:
+        remote = self._database._remote
+        if remote._is_known_missing(self.endpoint):
+            return False
+        modifications = remote._modifications
         try:
-            await self._head()
+            await remote._head(self.endpoint)
             return True
-        except NotFoundError:
-            return False
+        except aiohttp.ClientResponseError as e:
+            if e.status == 404:
+                remote._set_missing(self.endpoint, modifications)
+                return False
+            else:
+                raise e
 
     @raises(400, "The format of the request or revision was invalid")
     @raises(401, "Read privilege required for document '{id}'")
     @raises(403, "Read privilege required for document '{id}'")
     @raises(404, "Document {id} was not found")
     async def _get(self, **params: Any) -> JsonDict:
-        _, json = await self._database._remote._get(self.endpoint, params)
-        assert not isinstance(json, bytes)
+        remote = self._database._remote
+        if (
+            not params
+            and remote._get_batch_delay is not None
+            and not self.id.startswith("_")
+            # e.g., design documents live under a different endpoint
+            and self.endpoint == f"{self._database.endpoint}/{_quote_id(self.id)}"
+        ):
+            batched = await remote._batched_get(self._database.endpoint, self.id)
+            if batched is not None:
+                return batched
+
+        _, json = await remote._get(self.endpoint, params)
         return json
 
     @raises(400, "The format of the request or revision was invalid")
@@ -396,7 +877,6 @@ class RemoteDocument:
         self, data: JsonDict, **params: Any
     ) -> Tuple[HTTPResponse, JsonDict]:
         response, json = await self._database._remote._put(self.endpoint, data, params)
-        assert not isinstance(json, bytes)
         return (response, json)
 
     @raises(400, "Invalid request body or parameters")
@@ -409,7 +889,6 @@ class RemoteDocument:
     async def _delete(self, rev: str, **params: Any) -> Tuple[HTTPResponse, JsonDict]:
         params["rev"] = rev
         response, json = await self._database._remote._delete(self.endpoint, params)
-        assert not isinstance(json, bytes)
         return (response, json)
 
     @raises(400, "Invalid request body or parameters")
@@ -426,30 +905,26 @@ class RemoteDocument:
     async def _copy(
         self, destination: str, **params: Any
     ) -> Tuple[HTTPResponse, JsonDict]:
-        response, json = await self._database._remote._request(
+        response, json = await self._database._remote._request_json(
             "COPY", self.endpoint, params=params, headers={"Destination": destination}
         )
-        assert not isinstance(json, bytes)
         return (response, json)
 
 
 class RemoteAttachment:
+    __slots__ = ("_document", "id", "content_type", "endpoint", "__weakref__")
+
     def __init__(self, document: "document.Document", id: str):
         self._document = document
         self.id = id
         self.content_type: Optional[str] = None
-
-    @property
-    def endpoint(self) -> str:
-        return f"{self._document.endpoint}/{_quote_id(self.id)}"
+        self.endpoint = f"{document.endpoint}/{_quote_id(id)}"
 
     @raises(401, "Read privilege required for document '{document_id}'")
     @raises(403, "Read privilege required for document '{document_id}'")
     async def _exists(self) -> bool:
         try:
-            response, _ = await self._document._database._remote._head(
-                self.endpoint, return_json=False
-            )
+            response, _ = await self._document._database._remote._head(self.endpoint)
             self.content_type = response.headers["Content-Type"]
             return True
         except aiohttp.ClientResponseError as e:
@@ -467,7 +942,6 @@ class RemoteAttachment:
             self.endpoint, params
         )
         self.content_type = response.headers["Content-Type"]
-        assert isinstance(data, bytes)
         return data
 
     @raises(400, "Invalid request body or parameters")
@@ -478,14 +952,13 @@ class RemoteAttachment:
         409, "Specified revision {document_rev} is not the latest for target document"
     )
     async def _put(
-        self, rev: str, data: bytes, content_type: str, **params: Any
+        self, rev: str, data: BinaryData, content_type: str, **params: Any
     ) -> JsonDict:
         params["rev"] = rev
         _, json = await self._document._database._remote._put_bytes(
             self.endpoint, data, content_type, params
         )
         self.content_type = content_type
-        assert not isinstance(json, bytes)
         return json
 
     @raises(400, "Invalid request body or parameters")
@@ -499,23 +972,22 @@ class RemoteAttachment:
         params["rev"] = rev
         _, json = await self._document._database._remote._delete(self.endpoint, params)
         self.content_type = None
-        assert not isinstance(json, bytes)
         return json
 
 
 class RemoteView:
+    __slots__ = ("_database", "ddoc", "id", "endpoint", "__weakref__")
+
     def __init__(self, database: "database.Database", ddoc: Optional[str], id: str):
         self._database = database
         self.ddoc = ddoc
         self.id = id
-
-    @property
-    def endpoint(self) -> str:
-        assert self.ddoc is not None
-        return (
-            f"{self._database.endpoint}/_design/{_quote_id(self.ddoc)}/_view/"
-            f"{_quote_id(self.id)}"
-        )
+        if ddoc is None:
+            self.endpoint = f"{database.endpoint}/{_quote_id(id)}"
+        else:
+            self.endpoint = (
+                f"{database.endpoint}/_design/{_quote_id(ddoc)}/_view/{_quote_id(id)}"
+            )
 
     @raises(400, "Invalid request")
     @raises(401, "Read privileges required")
@@ -523,7 +995,6 @@ class RemoteView:
     @raises(404, "Specified database, design document or view is missing")
     async def _get(self, **params: Any) -> JsonDict:
         _, json = await self._database._remote._get(self.endpoint, params)
-        assert not isinstance(json, bytes)
         return json
 
     @raises(400, "Invalid request")
@@ -532,7 +1003,28 @@ class RemoteView:
     @raises(404, "Specified database, design document or view is missing")
     async def _post(self, keys: List[str], **params: Any) -> JsonDict:
         _, json = await self._database._remote._post(
-            self.endpoint, {"keys": keys}, params
+            self.endpoint, {"keys": keys}, params, modifies=False
         )
-        assert not isinstance(json, bytes)
         return json
+
+    @generator_raises(400, "Invalid request")
+    @generator_raises(401, "Read privileges required")
+    @generator_raises(403, "Read privileges required")
+    @generator_raises(404, "Specified database, design document or view is missing")
+    async def _get_rows(self, **params: Any) -> AsyncGenerator[JsonDict, None]:
+        async for row in self._database._remote._streamed_rows(
+            "GET", self.endpoint, params
+        ):
+            yield row
+
+    @generator_raises(400, "Invalid request")
+    @generator_raises(401, "Write privileges required")
+    @generator_raises(403, "Write privileges required")
+    @generator_raises(404, "Specified database, design document or view is missing")
+    async def _post_rows(
+        self, keys: List[str], **params: Any
+    ) -> AsyncGenerator[JsonDict, None]:
+        async for row in self._database._remote._streamed_rows(
+            "POST", self.endpoint, params, body={"keys": keys}
+        ):
+            yield row
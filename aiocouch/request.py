@@ -28,6 +28,7 @@
 # NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import asyncio
 from typing import Any, AsyncGenerator, Dict, Optional, cast
 
 from . import database
@@ -42,7 +43,6 @@ class FindRequestChunk:
         self.data = data
         self.pagination_size = pagination_size
 
-    @property
     async def docs(self) -> AsyncGenerator[Document, None]:
         for res in self.data["docs"]:
             doc = Document(self.database, res["_id"])
@@ -71,22 +71,37 @@ class FindRequest:
         self.limit = limit
         self.params = params
 
+    async def _chunk(self, pagination_size: int) -> FindRequestChunk:
+        return FindRequestChunk(
+            self.database,
+            await self.database._find(
+                self.selector, limit=pagination_size, **self.params
+            ),
+            pagination_size,
+        )
+
     async def __aiter__(self) -> AsyncGenerator[Document, None]:
         pagination_size = self.limit if self.limit is not None else 10000
 
+        chunk = await self._chunk(pagination_size)
         while True:
-            chunk = FindRequestChunk(
-                self.database,
-                await self.database._find(
-                    self.selector, limit=pagination_size, **self.params
-                ),
-                pagination_size,
-            )
-
             self.params["bookmark"] = chunk.bookmark
 
-            async for doc in chunk.docs:
-                yield doc
+            next_chunk: "Optional[asyncio.Future[FindRequestChunk]]" = None
+            if self.limit is None and not chunk.is_last_chunk:
+                # request the next page while the documents of this one are consumed
+                next_chunk = asyncio.ensure_future(self._chunk(pagination_size))
+
+            try:
+                async for doc in chunk.docs():
+                    yield doc
+            except BaseException:
+                if next_chunk is not None and not next_chunk.cancel():
+                    # mark the exception as retrieved, nobody is waiting for it
+                    if not next_chunk.cancelled():
+                        next_chunk.exception()
+                raise
 
-            if self.limit is not None or chunk.is_last_chunk:
+            if next_chunk is None:
                 break
+            chunk = await next_chunk
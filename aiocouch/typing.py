@@ -28,8 +28,9 @@
 # NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from typing import Any, Dict, List, Union
+from typing import IO, Any, AsyncIterable, Dict, List, Union
 
 JsonDict = Dict[str, Any]
 JsonList = List[Any]
 Json = Union[JsonDict, JsonList]
+BinaryData = Union[bytes, IO[bytes], AsyncIterable[bytes]]
@@ -28,6 +28,7 @@
 # NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import json
 from dataclasses import dataclass
 from typing import Any, AsyncGenerator, Dict, Generator, List, Optional, Tuple
 
@@ -68,31 +69,43 @@ class ViewResponse:
         include_ddocs: bool = False,
     ) -> Generator[Document, None, None]:
         for row in self.rows:
-            if "error" not in row and row["doc"] is not None:
-                if row["id"].startswith("_design/") and not include_ddocs:
-                    continue
-                doc = Document(self._database, row["id"])
-                doc._update_cache(row["doc"])
+            doc = _row_document(self._database, row, create, include_ddocs)
+            if doc is not None:
                 yield doc
-            elif create:
-                doc = Document(self._database, row["key"])
-                yield doc
-            else:
-                raise NotFoundError(
-                    f"The document '{row['key']}' does not exist in the database "
-                    f"{self._database.id}."
-                )
+
+
+def _row_document(
+    database: "database.Database", row: JsonDict, create: bool, include_ddocs: bool
+) -> Optional[Document]:
+    if "error" not in row and row["doc"] is not None:
+        if not include_ddocs and row["id"].startswith("_design/"):
+            return None
+        doc = Document(database, row["id"])
+        doc._update_cache(row["doc"])
+        return doc
+    elif create:
+        return Document(database, row["key"])
+    else:
+        raise NotFoundError(
+            f"The document '{row['key']}' does not exist in the database "
+            f"{database.id}."
+        )
 
 
 class View(RemoteView):
+    prefix_sentinel = "\uffff"
+
     def __init__(
         self, database: "database.Database", design_doc: Optional[str], id: str
     ):
         super().__init__(database, design_doc, id)
 
-    @property
-    def prefix_sentinel(self) -> str:
-        return "\uffff"
+    def _prefix_range(self, prefix: str) -> Tuple[str, str]:
+        # startkey and endkey are JSON, so the prefix needs proper escaping
+        return (
+            json.dumps(prefix, ensure_ascii=False),
+            json.dumps(prefix + self.prefix_sentinel, ensure_ascii=False),
+        )
 
     async def get(self, **params: Any) -> ViewResponse:
         return ViewResponse(_database=self._database, **(await self._get(**params)))
@@ -103,16 +116,19 @@ class View(RemoteView):
         )
 
     async def akeys(self, **params: Any) -> AsyncGenerator[str, None]:
-        for key in (await self.get(**params)).keys():
-            yield key
+        async for row in self._get_rows(**params):
+            if "error" not in row:
+                yield row["id"]
 
     async def aitems(self, **params: Any) -> AsyncGenerator[Tuple[str, Any], None]:
-        for key, value in (await self.get(**params)).items():
-            yield key, value,
+        async for row in self._get_rows(**params):
+            if "error" not in row:
+                yield row["key"], row["value"],
 
     async def avalues(self, **params: Any) -> AsyncGenerator[Any, None]:
-        for value in (await self.get(**params)).values():
-            yield value
+        async for row in self._get_rows(**params):
+            if "error" not in row:
+                yield row["value"]
 
     async def ids(
         self,
@@ -121,15 +137,17 @@ class View(RemoteView):
         **params: Any,
     ) -> AsyncGenerator[str, None]:
         if prefix is not None:
-            params["startkey"] = f'"{prefix}"'
-            params["endkey"] = f'"{prefix}{self.prefix_sentinel}"'
+            params["startkey"], params["endkey"] = self._prefix_range(prefix)
 
-        response = await (
-            self.get(**params) if keys is None else self.post(keys, **params)
+        rows = (
+            self._get_rows(**params)
+            if keys is None
+            else self._post_rows(keys, **params)
         )
 
-        for key in response.keys():
-            yield key
+        async for row in rows:
+            if "error" not in row:
+                yield row["id"]
 
     async def docs(
         self,
@@ -146,25 +164,20 @@ class View(RemoteView):
                     "prefix cannot be used together with ids or create parameter"
                 )
 
-            params["startkey"] = f'"{prefix}"'
-            params["endkey"] = f'"{prefix}{self.prefix_sentinel}"'
+            params["startkey"], params["endkey"] = self._prefix_range(prefix)
 
-        response = await (
-            self.get(**params) if ids is None else self.post(ids, **params)
+        rows = (
+            self._get_rows(**params) if ids is None else self._post_rows(ids, **params)
         )
 
-        for doc in response.docs(create=create, include_ddocs=include_ddocs):
-            yield doc
+        async for row in rows:
+            doc = _row_document(self._database, row, create, include_ddocs)
+            if doc is not None:
+                yield doc
 
 
 class AllDocsView(View):
+    prefix_sentinel = "\U0010fffe"
+
     def __init__(self, database: "database.Database"):
         super().__init__(database, None, "_all_docs")
-
-    @property
-    def endpoint(self) -> str:
-        return f"/{self._database.id}/_all_docs"
-
-    @property
-    def prefix_sentinel(self) -> str:
-        return chr(0x10FFFE)
@@ -1,3 +1,6 @@
+from io import BytesIO
+from typing import AsyncIterator
+
 import pytest
 
 from aiocouch import ConflictError, NotFoundError
@@ -49,6 +52,28 @@ async def test_save_on_unfetched(doc: Document) -> None:
     await att.save(text, "text/plain")
 
 
+async def test_save_file_object(doc: Document) -> None:
+    await doc.save()
+    await doc.attachment("image.webp").save(BytesIO(image), "image/webp")
+
+    att = doc.attachment("image.webp")
+    assert await att.fetch() == image
+    assert att.content_type == "image/webp"
+
+
+async def test_save_async_iterable(doc: Document) -> None:
+    async def chunks() -> AsyncIterator[bytes]:
+        for start in range(0, len(text), 64):
+            yield text[start : start + 64]
+
+    await doc.save()
+    await doc.attachment("lipsum.txt").save(chunks(), "text/plain")
+
+    att = doc.attachment("lipsum.txt")
+    assert await att.fetch() == text
+    assert att.content_type == "text/plain"
+
+
 async def test_get(doc: Document) -> None:
     await doc.save()
     await doc.attachment("image.webp").save(image, "image/webp")
@@ -187,3 +187,12 @@ async def test_changed_event_include_docs(filled_database: Database) -> None:
     # As we set the database to None, it either gets the Document instance
     # from the local json response, or fails trying to gather it from the remote
     await event.doc()
+
+
+async def test_event_for_last_seq() -> None:
+    json = {"last_seq": "42-abc", "pending": 0}
+    event = ChangedEvent(database=cast(Database, None), json=json)
+
+    # the final status line of a continuous feed is passed on as before
+    assert event.json is json
+    assert event.json["last_seq"] == "42-abc"
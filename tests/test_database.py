@@ -181,6 +181,15 @@ async def test_docs_with_prefix(filled_database: Database) -> None:
     assert (sorted(keys)) == ["baz", "baz2"]
 
 
+async def test_docs_with_escaped_prefix(filled_database: Database) -> None:
+    doc = await filled_database.create('ba"r')
+    await doc.save()
+
+    keys = [doc.id async for doc in filled_database.docs(prefix='ba"')]
+
+    assert keys == ['ba"r']
+
+
 async def test_docs_on_deleted(filled_database: Database) -> None:
     doc = await filled_database["foo"]
     await doc.delete()
@@ -1,4 +1,4 @@
-from typing import Any, cast
+from typing import Any, Tuple, cast
 
 import pytest
 
@@ -127,6 +127,67 @@ async def test_fetch_clean_document(filled_database: Database) -> None:
     await doc.fetch()
 
 
+async def test_concurrent_fetch(filled_database: Database) -> None:
+    import asyncio
+
+    foo, foo2, other_foo = await asyncio.gather(
+        filled_database["foo"], filled_database["foo2"], filled_database["foo"]
+    )
+
+    assert foo.id == other_foo.id == "foo"
+    assert foo2.id == "foo2"
+
+    foo["bar"] = "baz"
+    assert other_foo["bar"] is True
+
+
+async def test_batched_fetch(filled_database: Database) -> None:
+    import asyncio
+
+    filled_database._remote._get_batch_delay = 0.002
+
+    foo, foo2, missing = await asyncio.gather(
+        filled_database["foo"],
+        filled_database["foo2"],
+        filled_database["missing"],
+        return_exceptions=True,
+    )
+
+    assert isinstance(foo, Document) and foo.id == "foo"
+    assert isinstance(foo2, Document) and foo2.id == "foo2"
+    assert isinstance(missing, NotFoundError)
+
+
+async def test_fetch_with_etag_cache(
+    filled_database: Database, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from aiocouch.remote import HTTPResponse, RemoteServer
+
+    statuses = []
+    send_request = RemoteServer._send_request
+
+    async def recording_send_request(
+        self: RemoteServer, *args: Any, **kwargs: Any
+    ) -> Tuple[HTTPResponse, bytes]:
+        response, raw = await send_request(self, *args, **kwargs)
+        statuses.append(response.status)
+        return response, raw
+
+    monkeypatch.setattr(RemoteServer, "_send_request", recording_send_request)
+    filled_database._remote._etag_cache_size = 8
+
+    foo = await filled_database["foo"]
+    other_foo = await filled_database["foo"]
+
+    # the second fetch is revalidated and reuses the cached body
+    assert statuses == [200, 304]
+    assert other_foo["_rev"] == foo["_rev"]
+    assert other_foo["bar"] is True
+
+    foo["bar"] = False
+    assert other_foo["bar"] is True
+
+
 async def test_fetch_dirty_document(database: Database) -> None:
     from aiocouch import ConflictError
 
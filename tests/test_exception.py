@@ -67,6 +67,20 @@ class DummyEndpoint:
     async def raise_custom(self) -> NoReturn:
         raise ClientResponseError(cast(RequestInfo, None), (), status=500)
 
+    @raises(404, "{endpoint} not found")
+    async def raise_formatted(self) -> NoReturn:
+        raise ClientResponseError(cast(RequestInfo, None), (), status=404)
+
+    @raises(404, "{endpoint!r} not found")
+    async def raise_formatted_conversion(self) -> NoReturn:
+        raise ClientResponseError(cast(RequestInfo, None), (), status=404)
+
+    @raises(403, "outer thing")
+    @raises(404, "outer thing")
+    @raises(404, "inner thing")
+    async def raise_stacked(self, status: int) -> NoReturn:
+        raise ClientResponseError(cast(RequestInfo, None), (), status=status)
+
     @generator_raises(400, "bad thing")
     async def raise_in_generator(self) -> AsyncGenerator[JsonDict, None]:
         raise ClientResponseError(cast(RequestInfo, None), (), status=400)
@@ -105,3 +119,70 @@ async def test_raises() -> None:
     with pytest.raises(BadRequestError):
         async for _ in dummy.raise_in_generator():
             pass
+
+
+async def test_raises_formats_message() -> None:
+    dummy = DummyEndpoint()
+    with pytest.raises(NotFoundError, match="endpoint not found"):
+        await dummy.raise_formatted()
+
+    with pytest.raises(NotFoundError, match="'endpoint' not found"):
+        await dummy.raise_formatted_conversion()
+
+    with pytest.raises(BadRequestError, match="^bad thing$"):
+        await dummy.raise_bad_request()
+
+
+async def test_stacked_raises() -> None:
+    dummy = DummyEndpoint()
+    with pytest.raises(ForbiddenError, match="^outer thing$"):
+        await dummy.raise_stacked(403)
+
+    with pytest.raises(NotFoundError, match="inner thing"):
+        await dummy.raise_stacked(404)
+
+    with pytest.raises(ClientResponseError):
+        await dummy.raise_stacked(500)
+
+
+async def test_raises_keeps_function_kind() -> None:
+    import asyncio
+    import inspect
+    from unittest import mock
+
+    from aiocouch.document import SecurityDocument
+
+    assert asyncio.iscoroutinefunction(DummyEndpoint.raise_stacked)
+    assert asyncio.iscoroutinefunction(SecurityDocument.save)
+    assert inspect.isasyncgenfunction(DummyEndpoint.raise_in_generator)
+
+    spec = mock.create_autospec(DummyEndpoint)
+    assert isinstance(spec.raise_stacked, mock.AsyncMock)
+
+
+async def test_raises_keeps_decorated_function() -> None:
+    import functools
+
+    redecorated = raises(500, "other thing", CustomError)(DummyEndpoint.raise_stacked)
+
+    dummy = DummyEndpoint()
+    with pytest.raises(CustomError, match="^other thing$"):
+        await redecorated(dummy, 500)
+    with pytest.raises(ForbiddenError, match="^outer thing$"):
+        await redecorated(dummy, 403)
+
+    # the original method is not affected
+    with pytest.raises(ClientResponseError):
+        await dummy.raise_stacked(500)
+
+    @functools.wraps(DummyEndpoint.raise_stacked)
+    async def foreign(endpoint: DummyEndpoint, status: int) -> None:
+        await DummyEndpoint.raise_stacked(endpoint, status)
+
+    # a foreign wrapper isn't merged with, even though it copied the attributes
+    with pytest.raises(CustomError, match="^other thing$"):
+        await raises(500, "other thing", CustomError)(foreign)(dummy, 500)
+    with pytest.raises(ClientResponseError):
+        await dummy.raise_stacked(500)
+    with pytest.raises(NotFoundError, match="inner thing"):
+        await foreign(dummy, 404)
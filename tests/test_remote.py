@@ -1,3 +1,22 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Tuple
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+
+@asynccontextmanager
+async def serve(app: web.Application) -> AsyncIterator[str]:
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        yield f"http://{server.host}:{server.port}"
+    finally:
+        await server.close()
+
+
 def test_stringify_params() -> None:
     from aiocouch.remote import _stringify_params
 
@@ -7,3 +26,391 @@ def test_stringify_params() -> None:
     params = {"foo": "bar", "baz": True, "boo": False, "foz": None}
 
     assert _stringify_params(params) == {"foo": "bar", "baz": "true", "boo": "false"}
+
+    params = {"foo": "bar", "limit": 10}
+
+    assert _stringify_params(params) == {"foo": "bar", "limit": 10}
+
+
+def test_json_matches_stdlib() -> None:
+    import json
+    from datetime import date, datetime
+    from enum import IntEnum
+    from uuid import uuid4
+
+    from aiocouch.remote import _json_dumps, _json_loads
+
+    class Number(IntEnum):
+        ONE = 1
+
+    samples: Tuple[Any, ...] = (
+        {"a": None, 1: True, "b": [1.5, "c"]},
+        {"a": float("nan")},
+        {"a": [float("-inf")], "b": None},
+        {"a": 2**64},
+        {"a": Number.ONE, Number.ONE: "b"},
+    )
+    for data in samples:
+        assert _json_dumps(data) == json.dumps(data, separators=(",", ":")).encode()
+
+    rejected: Tuple[Any, ...] = (
+        {"a": datetime.now()},
+        {date.today(): 1},
+        {uuid4(): 1},
+    )
+    for data in rejected:
+        with pytest.raises(TypeError):
+            json.dumps(data)
+        with pytest.raises(TypeError):
+            _json_dumps(data)
+
+    assert _json_loads(b'{"a": 1e400}') == {"a": float("inf")}
+
+    for number in (2**64, -(2**63) - 1, 123456789012345678901234567890):
+        assert _json_loads(f'{{"a": [{number}]}}'.encode()) == {"a": [number]}
+
+
+def test_quote_id() -> None:
+    from aiocouch.remote import _quote_id
+
+    assert _quote_id("") == ""
+    assert _quote_id("Foo-Bar_1.2~3") == "Foo-Bar_1.2~3"
+    assert _quote_id("foo/bar") == "foo%2Fbar"
+    assert _quote_id("foo bar") == "foo%20bar"
+    assert _quote_id("_design/🛋️") == "_design%2F%F0%9F%9B%8B%EF%B8%8F"
+
+
+async def test_endpoints_are_quoted() -> None:
+    from aiocouch import CouchDB, Database, Document
+    from aiocouch.design_document import DesignDocument
+
+    async with CouchDB("http://localhost:5984") as couchdb:
+        database = Database(couchdb, "my/db")
+        assert database.endpoint == "/my%2Fdb"
+        assert database.all_docs.endpoint == "/my%2Fdb/_all_docs"
+        assert database.view("d d", "v").endpoint == "/my%2Fdb/_design/d%20d/_view/v"
+
+        doc = Document(database, "a b")
+        assert doc.endpoint == "/my%2Fdb/a%20b"
+        assert doc.attachment("c/d").endpoint == "/my%2Fdb/a%20b/c%2Fd"
+
+        ddoc = DesignDocument(database, "e")
+        assert ddoc.endpoint == "/my%2Fdb/_design/e"
+
+
+async def test_url() -> None:
+    from aiocouch.remote import RemoteServer
+
+    remote = RemoteServer("http://localhost:5984")
+    assert str(remote._url("/my%2Fdb/a%20b")) == "http://localhost:5984/my%2Fdb/a%20b"
+    await remote.close()
+
+    remote = RemoteServer("https://localhost/couchdb/")
+    assert str(remote._url("/_all_dbs")) == "https://localhost/couchdb/_all_dbs"
+    await remote.close()
+
+
+async def test_default_headers() -> None:
+    from aiocouch.remote import RemoteServer
+
+    remote = RemoteServer("http://localhost:5984", headers={"X-Foo": "bar"})
+    assert remote._http_session.headers["X-Foo"] == "bar"
+    await remote.close()
+
+    remote = RemoteServer(
+        "http://localhost:5984", cookie="abc", headers={"X-Foo": "bar"}
+    )
+    assert remote._http_session.headers["X-Foo"] == "bar"
+    assert remote._http_session.headers["Cookie"] == "AuthSession=abc"
+    await remote.close()
+
+
+async def test_coalesced_get_after_put() -> None:
+    from aiocouch.remote import RemoteServer
+
+    doc = {"_id": "a", "_rev": "1-a"}
+    first_get = asyncio.Event()
+    release = asyncio.Event()
+
+    async def get(request: web.Request) -> web.Response:
+        response = dict(doc)
+        if not first_get.is_set():
+            first_get.set()
+            await release.wait()
+        return web.json_response(response)
+
+    async def put(request: web.Request) -> web.Response:
+        doc["_rev"] = "2-x"
+        return web.json_response({"ok": True, "id": "a", "rev": "2-x"})
+
+    app = web.Application()
+    app.router.add_get("/db/a", get)
+    app.router.add_put("/db/a", put)
+
+    async with serve(app) as url:
+        remote = RemoteServer(url, coalesce_requests=True)
+
+        first = asyncio.ensure_future(remote._get("/db/a"))
+        second = asyncio.ensure_future(remote._get("/db/a"))
+        await first_get.wait()
+        await remote._put("/db/a", {"_id": "a"})
+        third = asyncio.ensure_future(remote._get("/db/a"))
+        await asyncio.wait([third], timeout=1)
+        release.set()
+
+        # the requests before the modification are shared, the one after is not
+        assert (await first)[1]["_rev"] == "1-a"
+        assert (await second)[1]["_rev"] == "1-a"
+        assert (await third)[1]["_rev"] == "2-x"
+
+        await remote.close()
+
+
+async def test_streamed_rows_with_slow_consumer() -> None:
+    from aiohttp import ClientTimeout
+
+    from aiocouch.remote import RemoteServer
+
+    rows = [{"id": f"doc{i}", "key": f"doc{i}", "value": None} for i in range(40000)]
+
+    async def all_docs(request: web.Request) -> web.Response:
+        return web.json_response({"total_rows": len(rows), "offset": 0, "rows": rows})
+
+    app = web.Application()
+    app.router.add_get("/db/_all_docs", all_docs)
+
+    async with serve(app) as url:
+        remote = RemoteServer(url, timeout=ClientTimeout(total=0.5), stream_rows=True)
+
+        count = 0
+        async for row in remote._streamed_rows("GET", "/db/_all_docs"):
+            count += 1
+            if count % 1000 == 0:
+                # the caller takes longer than the total timeout of the session
+                await asyncio.sleep(0.025)
+
+        assert count == len(rows)
+
+        await remote.close()
+
+
+async def test_missing_cache() -> None:
+    from aiocouch import CouchDB, Database, Document
+
+    exists = False
+    heads = 0
+    put_started = asyncio.Event()
+    release_put = asyncio.Event()
+
+    async def head(request: web.Request) -> web.Response:
+        nonlocal heads
+        heads += 1
+        if not exists:
+            raise web.HTTPNotFound()
+        return web.Response(headers={"ETag": '"1-a"'})
+
+    async def put(request: web.Request) -> web.Response:
+        nonlocal exists
+        put_started.set()
+        await release_put.wait()
+        exists = True
+        return web.json_response({"ok": True, "id": "a", "rev": "1-a"})
+
+    app = web.Application()
+    app.router.add_head("/db/a", head)
+    app.router.add_put("/db/a", put)
+
+    async with serve(app) as url:
+        async with CouchDB(url, missing_cache_ttl=60) as couchdb:
+            doc = Document(Database(couchdb, "db"), "a")
+
+            assert not await doc._exists()
+            assert not await doc._exists()
+            assert heads == 1
+
+            # the document is found missing while it is created
+            save = asyncio.ensure_future(couchdb._server._put("/db/a", {"_id": "a"}))
+            await put_started.wait()
+            assert not await doc._exists()
+            assert heads == 2
+
+            release_put.set()
+            await save
+
+            assert await doc._exists()
+            assert heads == 3
+
+
+def bulk_get_app(
+    documents: Dict[str, Dict[str, Any]],
+) -> Tuple[web.Application, List[List[str]]]:
+    # answers _bulk_get like CouchDB, documents maps ids to the stored data
+    # and the returned list records the ids of every _bulk_get request
+    bulk_gets: List[List[str]] = []
+
+    async def bulk_get(request: web.Request) -> web.Response:
+        ids = [doc["id"] for doc in (await request.json())["docs"]]
+        bulk_gets.append(ids)
+        results = []
+        for id in ids:
+            if id in documents:
+                docs: List[Dict[str, Any]] = [{"ok": documents[id]}]
+            else:
+                docs = [{"error": {"id": id, "error": "not_found"}}]
+            results.append({"id": id, "docs": docs})
+        return web.json_response({"results": results})
+
+    async def get(request: web.Request) -> web.Response:
+        id = request.match_info["id"]
+        doc = documents.get(id)
+        if doc is None or doc.get("_deleted"):
+            raise web.HTTPNotFound()
+        return web.json_response(doc)
+
+    app = web.Application()
+    app.router.add_post("/db/_bulk_get", bulk_get)
+    app.router.add_get("/db/{id:.+}", get)
+    return app, bulk_gets
+
+
+async def test_batched_fetch_of_design_documents() -> None:
+    from aiocouch import CouchDB, Database
+    from aiocouch.design_document import DesignDocument
+
+    app, bulk_gets = bulk_get_app(
+        {
+            "_design/a": {"_id": "_design/a", "_rev": "1-a", "views": {}},
+            "_design/b": {"_id": "_design/b", "_rev": "1-b", "views": {}},
+            # plain documents with the same id as the design documents
+            "a": {"_id": "a", "_rev": "1-x"},
+            "b": {"_id": "b", "_rev": "1-y"},
+        }
+    )
+
+    async with serve(app) as url:
+        async with CouchDB(url, get_batch_delay=0.01) as couchdb:
+            database = Database(couchdb, "db")
+            a = DesignDocument(database, "a")
+            b = DesignDocument(database, "b")
+
+            await asyncio.gather(a.fetch(), b.fetch())
+
+            assert a["_rev"] == "1-a"
+            assert b["_rev"] == "1-b"
+            assert bulk_gets == []
+
+
+async def test_batched_fetch_of_deleted_and_missing_documents() -> None:
+    from aiocouch import CouchDB, Database, Document, NotFoundError
+
+    app, bulk_gets = bulk_get_app(
+        {
+            "a": {"_id": "a", "_rev": "1-a"},
+            "deleted": {"_id": "deleted", "_rev": "2-d", "_deleted": True},
+        }
+    )
+
+    async with serve(app) as url:
+        async with CouchDB(url, get_batch_delay=0.01) as couchdb:
+            database = Database(couchdb, "db")
+            a = Document(database, "a")
+            deleted = Document(database, "deleted")
+            missing = Document(database, "missing")
+
+            results = await asyncio.gather(
+                a.fetch(), deleted.fetch(), missing.fetch(), return_exceptions=True
+            )
+
+            assert bulk_gets == [["a", "deleted", "missing"]]
+            assert results[0] is None and a["_rev"] == "1-a"
+            assert isinstance(results[1], NotFoundError)
+            assert isinstance(results[2], NotFoundError)
+
+
+async def test_streamed_rows_with_stalled_server() -> None:
+    from aiohttp import ClientTimeout
+
+    from aiocouch.remote import RemoteServer
+
+    async def all_docs(request: web.Request) -> web.StreamResponse:
+        response = web.StreamResponse(headers={"Content-Type": "application/json"})
+        await response.prepare(request)
+        await response.write(b'{"offset": 0, "rows": [{"id": "a", "key": "a"},')
+        # the server stalls after the first row
+        await asyncio.sleep(10)
+        return response
+
+    app = web.Application()
+    app.router.add_get("/db/_all_docs", all_docs)
+
+    async with serve(app) as url:
+        remote = RemoteServer(url, timeout=ClientTimeout(total=0.2), stream_rows=True)
+
+        rows = []
+        with pytest.raises(asyncio.TimeoutError):
+            async for row in remote._streamed_rows("GET", "/db/_all_docs"):
+                rows.append(row)
+
+        assert rows == [{"id": "a", "key": "a"}]
+
+        await remote.close()
+
+
+async def test_connector_ignores_limits() -> None:
+    from aiohttp import TCPConnector
+
+    from aiocouch import CouchDB
+
+    connector = TCPConnector(limit=5)
+    async with CouchDB(
+        "http://localhost:5984", connector=connector, limit=10, keepalive_timeout=5
+    ) as couchdb:
+        assert couchdb._server._http_session.connector is connector
+        assert connector.limit == 5
+
+
+async def test_batched_fetch_keeps_missing_cache() -> None:
+    from aiocouch import CouchDB, Database, Document
+
+    app, bulk_gets = bulk_get_app(
+        {"a": {"_id": "a", "_rev": "1-a"}, "b": {"_id": "b", "_rev": "1-b"}}
+    )
+
+    async with serve(app) as url:
+        async with CouchDB(url, get_batch_delay=0.01, missing_cache_ttl=60) as couchdb:
+            database = Database(couchdb, "db")
+            missing = Document(database, "missing")
+            assert not await missing._exists()
+
+            await asyncio.gather(
+                Document(database, "a").fetch(), Document(database, "b").fetch()
+            )
+
+            # the read-only _bulk_get request doesn't count as a modification
+            assert bulk_gets == [["a", "b"]]
+            assert couchdb._server._is_known_missing(missing.endpoint)
+
+
+async def test_streamed_rows_with_big_integers() -> None:
+    import json
+
+    from aiocouch.remote import RemoteServer
+
+    rows = [{"id": "a", "key": "a", "value": 2**64 + 1}]
+
+    async def view(request: web.Request) -> web.Response:
+        body = json.dumps({"total_rows": 1, "offset": 0, "rows": rows})
+        return web.Response(body=body, content_type="application/json")
+
+    app = web.Application()
+    app.router.add_get("/db/_design/d/_view/v", view)
+
+    async with serve(app) as url:
+        remote = RemoteServer(url)
+
+        # without stream_rows, rows ijson can't parse are still returned
+        assert [
+            row async for row in remote._streamed_rows("GET", "/db/_design/d/_view/v")
+        ] == rows
+
+        await remote.close()